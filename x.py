@@ -4,10 +4,15 @@ Pika to Bee Rebranding Script
 Renames files, folders, and replaces content throughout the codebase
 """
 
+import codecs
+import io
 import os
 import re
+import sys
+import zipfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 class BeeRebrander:
     def __init__(self, base_path: str = "./pika-kmp"):
@@ -79,6 +84,19 @@ class BeeRebrander:
             'files_modified': 0,
             'replacements_made': 0
         }
+        
+        # Per-file progress lines, written out once per directory
+        self._pending_output: List[str] = []
+    
+    def _emit(self, message: str) -> None:
+        """Queue a per-file progress line"""
+        self._pending_output.append(message)
+    
+    def _flush_output(self) -> None:
+        """Write all queued progress lines with a single stdout write"""
+        if self._pending_output:
+            sys.stdout.write("\n".join(self._pending_output) + "\n")
+            self._pending_output.clear()
     
     def should_skip(self, path: Path) -> bool:
         """Check if path should be skipped"""
@@ -130,7 +148,7 @@ class BeeRebrander:
             new_name = self.rename_path_component(file_path.name)
             if new_name != file_path.name:
                 new_path = file_path.parent / new_name
-                print(f"  📄 Renaming file: {file_path.name} → {new_name}")
+                self._emit(f"  📄 Renaming file: {file_path.name} → {new_name}")
                 file_path.rename(new_path)
                 self.stats['files_renamed'] += 1
             return
@@ -147,7 +165,7 @@ class BeeRebrander:
             if replacements > 0:
                 with open(file_path, 'w', encoding='utf-8') as f:
                     f.write(modified_content)
-                print(f"  ✏️  Modified: {file_path.name} ({replacements} replacements)")
+                self._emit(f"  ✏️  Modified: {file_path.name} ({replacements} replacements)")
                 self.stats['files_modified'] += 1
                 self.stats['replacements_made'] += replacements
             
@@ -155,12 +173,12 @@ class BeeRebrander:
             new_name = self.rename_path_component(file_path.name)
             if new_name != file_path.name:
                 new_path = file_path.parent / new_name
-                print(f"  📄 Renaming: {file_path.name} → {new_name}")
+                self._emit(f"  📄 Renaming: {file_path.name} → {new_name}")
                 file_path.rename(new_path)
                 self.stats['files_renamed'] += 1
                 
         except Exception as e:
-            print(f"  ⚠️  Error processing {file_path}: {e}")
+            self._emit(f"  ⚠️  Error processing {file_path}: {e}")
     
     def process_directory(self, dir_path: Path) -> None:
         """Process all files in directory recursively"""
@@ -169,10 +187,14 @@ class BeeRebrander:
         
         print(f"\n📁 Processing directory: {dir_path.name}")
         
-        # First, process all files
-        for item in sorted(dir_path.iterdir()):
-            if item.is_file():
-                self.process_file(item)
+        # First, process all files; flush even if a rename raises so lines
+        # for operations already done are not lost
+        try:
+            for item in sorted(dir_path.iterdir()):
+                if item.is_file():
+                    self.process_file(item)
+        finally:
+            self._flush_output()
         
         # Then process subdirectories recursively
         for item in sorted(dir_path.iterdir()):
@@ -360,256 +382,388 @@ If issues arise:
         print(f"  3. Test build: ./gradlew clean build")
         print(f"  4. Update external services (Firebase, stores, etc.)")
 
-class BeeKMPGenerator:
-    """Generate fresh Bee KMP structure"""
-    def __init__(self, base_path: str = "./bee-kmp"):
-        self.base_path = Path(base_path)
+# Bee KMP scaffold manifest, relative to the generator's base path.
+# Keys are directories (an empty key means the enclosing directory);
+# values are either a tuple of file names or a nested subtree.
+# Beware repeating a key within one dict literal: Python silently keeps
+# only the last value, so the earlier group vanishes before compile()'s
+# duplicate check ever sees it. Merge such groups by hand instead.
+_Tree = Dict[str, Union[Tuple[str, ...], dict]]
+_Batch = Tuple[str, Tuple[str, ...]]
+
+_BEE_KMP_TREE: _Tree = {
+    # Root files, plus Docker & deployment
+    "": (
+        "README.md",
+        ".gitignore",
+        "settings.gradle.kts",
+        "gradle.properties",
+        "build.gradle.kts",
+        "Dockerfile",
+        ".dockerignore"
+    ),
     
-    def generate(self):
-        """Generate complete Bee KMP+CMP structure"""
-        print("🐝 Generating Bee KMP+CMP Structure...")
-        print("🍯 Where conversations buzz\n")
-        
-        # Root files
-        root_files = [
-            "README.md",
-            ".gitignore",
-            "settings.gradle.kts",
-            "gradle.properties",
-            "build.gradle.kts"
-        ]
-        
-        # Shared module (KMP+CMP)
-        shared_files = [
+    # Shared module (KMP+CMP)
+    "shared": {
+        "src/commonMain/kotlin/com/bee/app": {
             # Main app
-            "shared/src/commonMain/kotlin/com/bee/app/App.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/di/AppModule.kt",
-            
-            # Core features - Feed
-            "shared/src/commonMain/kotlin/com/bee/app/features/feed/FeedScreen.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/feed/FeedViewModel.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/feed/components/BuzzCard.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/feed/components/HiveNotes.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/feed/components/TrendingWords.kt",
-            
-            # Compose (Create Buzz)
-            "shared/src/commonMain/kotlin/com/bee/app/features/compose/ComposeScreen.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/compose/ComposeViewModel.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/compose/components/BuzzEditor.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/compose/components/FontPicker.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/compose/components/ColorGradient.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/compose/components/EmojiPicker.kt",
-            
-            # Thread view
-            "shared/src/commonMain/kotlin/com/bee/app/features/thread/ThreadScreen.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/thread/ThreadViewModel.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/thread/components/ThreadTree.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/thread/components/ReplyCard.kt",
-            
-            # Explore
-            "shared/src/commonMain/kotlin/com/bee/app/features/explore/ExploreScreen.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/explore/ExploreViewModel.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/explore/components/TrendingSection.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/explore/components/HiveSections.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/explore/components/ThreadOfTheDay.kt",
-            
-            # Profile
-            "shared/src/commonMain/kotlin/com/bee/app/features/profile/ProfileScreen.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/profile/ProfileViewModel.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/profile/components/ProfileHeader.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/profile/components/StatsCard.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/profile/components/BuzzesList.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/profile/components/BadgeGrid.kt",
-            
-            # Settings & Customization
-            "shared/src/commonMain/kotlin/com/bee/app/features/settings/SettingsScreen.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/settings/SettingsViewModel.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/settings/components/PalettePicker.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/settings/components/SafetyControls.kt",
-            
-            # Communities (Hive Sections)
-            "shared/src/commonMain/kotlin/com/bee/app/features/communities/CommunitiesScreen.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/communities/CommunityViewModel.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/communities/components/CommunityCard.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/communities/components/CommunityFeed.kt",
-            
-            # Notifications
-            "shared/src/commonMain/kotlin/com/bee/app/features/notifications/NotificationsScreen.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/notifications/NotificationsViewModel.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/notifications/components/NotificationCard.kt",
-            
-            # Messages/DMs
-            "shared/src/commonMain/kotlin/com/bee/app/features/messages/MessagesScreen.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/messages/MessagesViewModel.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/messages/ChatScreen.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/messages/ChatViewModel.kt",
-            
-            # Onboarding
-            "shared/src/commonMain/kotlin/com/bee/app/features/onboarding/OnboardingScreen.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/onboarding/PaletteSelectionScreen.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/features/onboarding/InterestsScreen.kt",
+            "": ("App.kt",),
+            "di": ("AppModule.kt",),
             
-            # Domain models
-            "shared/src/commonMain/kotlin/com/bee/app/domain/model/Buzz.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/domain/model/User.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/domain/model/Community.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/domain/model/Notification.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/domain/model/Palette.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/domain/model/Badge.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/domain/model/UserLevel.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/domain/model/ReplyStreak.kt",
-            
-            # Repositories
-            "shared/src/commonMain/kotlin/com/bee/app/domain/repository/BuzzRepository.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/domain/repository/UserRepository.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/domain/repository/CommunityRepository.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/domain/repository/NotificationRepository.kt",
-            
-            # Use cases
-            "shared/src/commonMain/kotlin/com/bee/app/domain/usecase/CreateBuzzUseCase.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/domain/usecase/RebuzzUseCase.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/domain/usecase/GetFeedUseCase.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/domain/usecase/GetThreadUseCase.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/domain/usecase/VibeCheckUseCase.kt",
-            
-            # Data layer
-            "shared/src/commonMain/kotlin/com/bee/app/data/remote/BeeApi.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/data/remote/NetworkClient.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/data/remote/dto/BuzzDto.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/data/remote/dto/UserDto.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/data/repository/BuzzRepositoryImpl.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/data/repository/UserRepositoryImpl.kt",
-            
-            # Local storage
-            "shared/src/commonMain/kotlin/com/bee/app/data/local/BeeDatabase.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/data/local/dao/BuzzDao.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/data/local/dao/UserDao.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/data/local/entity/BuzzEntity.kt",
-            
-            # UI components
-            "shared/src/commonMain/kotlin/com/bee/app/ui/components/BeeButton.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/ui/components/BeeTextField.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/ui/components/BeeTopBar.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/ui/components/BeeBottomBar.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/ui/components/StingButton.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/ui/components/ReactionPicker.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/ui/components/UserAvatar.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/ui/components/BadgeIcon.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/ui/components/StreakIndicator.kt",
-            
-            # Theme system
-            "shared/src/commonMain/kotlin/com/bee/app/ui/theme/BeeTheme.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/ui/theme/ColorPalette.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/ui/theme/HoneycombTheme.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/ui/theme/Palettes.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/ui/theme/Typography.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/ui/theme/Shapes.kt",
-            
-            # Animations
-            "shared/src/commonMain/kotlin/com/bee/app/ui/animations/StingAnimation.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/ui/animations/BuzzAnimation.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/ui/animations/HexagonAnimation.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/ui/animations/MascotAnimation.kt",
+            "features": {
+                # Core features - Feed
+                "feed": ("FeedScreen.kt", "FeedViewModel.kt"),
+                "feed/components": ("BuzzCard.kt", "HiveNotes.kt", "TrendingWords.kt"),
+                
+                # Compose (Create Buzz)
+                "compose": ("ComposeScreen.kt", "ComposeViewModel.kt"),
+                "compose/components": (
+                    "BuzzEditor.kt", "FontPicker.kt", "ColorGradient.kt", "EmojiPicker.kt"
+                ),
+                
+                # Thread view
+                "thread": ("ThreadScreen.kt", "ThreadViewModel.kt"),
+                "thread/components": ("ThreadTree.kt", "ReplyCard.kt"),
+                
+                # Explore
+                "explore": ("ExploreScreen.kt", "ExploreViewModel.kt"),
+                "explore/components": (
+                    "TrendingSection.kt", "HiveSections.kt", "ThreadOfTheDay.kt"
+                ),
+                
+                # Profile
+                "profile": ("ProfileScreen.kt", "ProfileViewModel.kt"),
+                "profile/components": (
+                    "ProfileHeader.kt", "StatsCard.kt", "BuzzesList.kt", "BadgeGrid.kt"
+                ),
+                
+                # Settings & Customization
+                "settings": ("SettingsScreen.kt", "SettingsViewModel.kt"),
+                "settings/components": ("PalettePicker.kt", "SafetyControls.kt"),
+                
+                # Communities (Hive Sections)
+                "communities": ("CommunitiesScreen.kt", "CommunityViewModel.kt"),
+                "communities/components": ("CommunityCard.kt", "CommunityFeed.kt"),
+                
+                # Notifications
+                "notifications": ("NotificationsScreen.kt", "NotificationsViewModel.kt"),
+                "notifications/components": ("NotificationCard.kt",),
+                
+                # Messages/DMs
+                "messages": (
+                    "MessagesScreen.kt", "MessagesViewModel.kt",
+                    "ChatScreen.kt", "ChatViewModel.kt"
+                ),
+                
+                # Onboarding
+                "onboarding": (
+                    "OnboardingScreen.kt", "PaletteSelectionScreen.kt", "InterestsScreen.kt"
+                ),
+            },
+            
+            "domain": {
+                # Domain models
+                "model": (
+                    "Buzz.kt", "User.kt", "Community.kt", "Notification.kt",
+                    "Palette.kt", "Badge.kt", "UserLevel.kt", "ReplyStreak.kt"
+                ),
+                
+                # Repositories
+                "repository": (
+                    "BuzzRepository.kt", "UserRepository.kt",
+                    "CommunityRepository.kt", "NotificationRepository.kt"
+                ),
+                
+                # Use cases
+                "usecase": (
+                    "CreateBuzzUseCase.kt", "RebuzzUseCase.kt", "GetFeedUseCase.kt",
+                    "GetThreadUseCase.kt", "VibeCheckUseCase.kt"
+                ),
+            },
+            
+            "data": {
+                # Data layer
+                "remote": ("BeeApi.kt", "NetworkClient.kt"),
+                "remote/dto": ("BuzzDto.kt", "UserDto.kt"),
+                "repository": ("BuzzRepositoryImpl.kt", "UserRepositoryImpl.kt"),
+                
+                # Local storage
+                "local": ("BeeDatabase.kt",),
+                "local/dao": ("BuzzDao.kt", "UserDao.kt"),
+                "local/entity": ("BuzzEntity.kt",),
+            },
+            
+            "ui": {
+                # UI components
+                "components": (
+                    "BeeButton.kt", "BeeTextField.kt", "BeeTopBar.kt", "BeeBottomBar.kt",
+                    "StingButton.kt", "ReactionPicker.kt", "UserAvatar.kt",
+                    "BadgeIcon.kt", "StreakIndicator.kt"
+                ),
+                
+                # Theme system
+                "theme": (
+                    "BeeTheme.kt", "ColorPalette.kt", "HoneycombTheme.kt",
+                    "Palettes.kt", "Typography.kt", "Shapes.kt"
+                ),
+                
+                # Animations
+                "animations": (
+                    "StingAnimation.kt", "BuzzAnimation.kt",
+                    "HexagonAnimation.kt", "MascotAnimation.kt"
+                ),
+            },
             
             # Utils
-            "shared/src/commonMain/kotlin/com/bee/app/utils/DateUtils.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/utils/StringUtils.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/utils/ValidationUtils.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/utils/Logger.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/utils/HapticFeedback.kt",
+            "utils": (
+                "DateUtils.kt", "StringUtils.kt", "ValidationUtils.kt",
+                "Logger.kt", "HapticFeedback.kt"
+            ),
             
             # Gamification
-            "shared/src/commonMain/kotlin/com/bee/app/gamification/XPManager.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/gamification/AchievementEngine.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/gamification/BadgeUnlocker.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/gamification/StreakTracker.kt",
+            "gamification": (
+                "XPManager.kt", "AchievementEngine.kt", "BadgeUnlocker.kt", "StreakTracker.kt"
+            ),
             
             # Safety
-            "shared/src/commonMain/kotlin/com/bee/app/safety/ContentFilter.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/safety/AgeScopeManager.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/safety/VibeCheckAI.kt",
-            "shared/src/commonMain/kotlin/com/bee/app/safety/ModerationTools.kt",
-            
-            # Platform-specific
-            "shared/src/androidMain/kotlin/com/bee/app/platform/HapticFeedback.android.kt",
-            "shared/src/androidMain/kotlin/com/bee/app/platform/ShareSheet.android.kt",
-            "shared/src/iosMain/kotlin/com/bee/app/platform/HapticFeedback.ios.kt",
-            "shared/src/iosMain/kotlin/com/bee/app/platform/ShareSheet.ios.kt",
-            
-            # Resources
-            "shared/src/commonMain/resources/drawable/logo.xml",
-            "shared/src/commonMain/resources/drawable/mascot.xml",
-            "shared/src/commonMain/resources/drawable/bee_icon.xml",
-            "shared/src/commonMain/resources/drawable/hexagon.xml",
-            
-            # Tests
-            "shared/src/commonTest/kotlin/com/bee/app/BuzzViewModelTest.kt",
-            "shared/src/commonTest/kotlin/com/bee/app/VibeCheckTest.kt",
-            "shared/src/commonTest/kotlin/com/bee/app/XPManagerTest.kt",
-            
-            # Build
-            "shared/build.gradle.kts"
-        ]
-        
-        # Android app
-        android_files = [
-            "androidApp/src/main/kotlin/com/bee/app/MainActivity.kt",
-            "androidApp/src/main/kotlin/com/bee/app/BeeApplication.kt",
-            "androidApp/src/main/AndroidManifest.xml",
-            "androidApp/src/main/res/values/strings.xml",
-            "androidApp/src/main/res/values/colors.xml",
-            "androidApp/src/main/res/values/themes.xml",
-            "androidApp/src/main/res/drawable/ic_launcher.xml",
-            "androidApp/build.gradle.kts",
-            "androidApp/proguard-rules.pro"
-        ]
-        
-        # iOS app
-        ios_files = [
-            "iosApp/iosApp/ContentView.swift",
-            "iosApp/iosApp/BeeApp.swift",
-            "iosApp/iosApp/Assets.xcassets/AppIcon.appiconset/Contents.json",
-            "iosApp/iosApp/Info.plist"
-        ]
-        
-        # Desktop app
-        desktop_files = [
-            "desktopApp/src/jvmMain/kotlin/com/bee/app/main.kt",
-            "desktopApp/build.gradle.kts"
-        ]
-        
-        # CI/CD
-        cicd_files = [
-            ".github/workflows/android-build.yml",
-            ".github/workflows/ios-build.yml",
-            ".github/workflows/tests.yml"
-        ]
-        
-        # Docker & deployment
-        deployment_files = [
-            "Dockerfile",
-            ".dockerignore"
-        ]
-        
-        # Create all files
-        all_files = (root_files + shared_files + android_files + 
-                    ios_files + desktop_files + cicd_files + deployment_files)
-        
-        for file_path in all_files:
-            full_path = self.base_path / file_path
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            full_path.touch()
-        
-        print(f"✅ Created {len(all_files)} empty files")
-        print(f"📁 Location: {self.base_path.absolute()}")
-        print("\n📂 Structure:")
-        print("  ├── shared/           # KMP+CMP core")
-        print("  │   ├── features/     # Feed, Compose, Thread, etc.")
-        print("  │   ├── domain/       # Models, repos, use cases")
-        print("  │   ├── data/         # Network, local storage")
-        print("  │   ├── ui/           # Components, theme, animations")
-        print("  │   ├── gamification/ # XP, badges, streaks")
-        print("  │   └── safety/       # Content filter, vibe check")
-        print("  ├── androidApp/       # Android target")
-        print("  ├── iosApp/           # iOS target")
-        print
+            "safety": (
+                "ContentFilter.kt", "AgeScopeManager.kt", "VibeCheckAI.kt", "ModerationTools.kt"
+            ),
+        },
+        
+        # Platform-specific
+        "src/androidMain/kotlin/com/bee/app/platform": (
+            "HapticFeedback.android.kt", "ShareSheet.android.kt"
+        ),
+        "src/iosMain/kotlin/com/bee/app/platform": (
+            "HapticFeedback.ios.kt", "ShareSheet.ios.kt"
+        ),
+        
+        # Resources
+        "src/commonMain/resources/drawable": (
+            "logo.xml", "mascot.xml", "bee_icon.xml", "hexagon.xml"
+        ),
+        
+        # Tests
+        "src/commonTest/kotlin/com/bee/app": (
+            "BuzzViewModelTest.kt", "VibeCheckTest.kt", "XPManagerTest.kt"
+        ),
+        
+        # Build
+        "": ("build.gradle.kts",),
+    },
+    
+    # Android app
+    "androidApp": {
+        "src/main/kotlin/com/bee/app": ("MainActivity.kt", "BeeApplication.kt"),
+        "src/main": ("AndroidManifest.xml",),
+        "src/main/res/values": ("strings.xml", "colors.xml", "themes.xml"),
+        "src/main/res/drawable": ("ic_launcher.xml",),
+        "": ("build.gradle.kts", "proguard-rules.pro"),
+    },
+    
+    # iOS app
+    "iosApp/iosApp": {
+        "": ("ContentView.swift", "BeeApp.swift", "Info.plist"),
+        "Assets.xcassets/AppIcon.appiconset": ("Contents.json",),
+    },
+    
+    # Desktop app
+    "desktopApp": {
+        "src/jvmMain/kotlin/com/bee/app": ("main.kt",),
+        "": ("build.gradle.kts",),
+    },
+    
+    # CI/CD
+    ".github/workflows": ("android-build.yml", "ios-build.yml", "tests.yml"),
+}
+
+# Create-if-missing without O_TRUNC, so re-runs never clobber edited files
+_TOUCH_FLAGS = os.O_WRONLY | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+
+# Where supported, siblings are created relative to an open directory fd
+_HAVE_DIR_FD = (
+    os.open in os.supports_dir_fd
+    and os.listdir in os.supports_fd
+    and hasattr(os, "O_DIRECTORY")
+)
+
+def _touch(path: str, dir_fd: Optional[int] = None) -> None:
+    """Create an empty file if it does not already exist"""
+    os.close(os.open(path, _TOUCH_FLAGS, 0o644, dir_fd=dir_fd))
+
+def _walk(tree: _Tree, prefix: str = "") -> Iterator[_Batch]:
+    """Yield (directory, file names) pairs described by a manifest tree"""
+    for key, node in tree.items():
+        directory = f"{prefix}/{key}" if prefix and key else prefix or key
+        if isinstance(node, dict):
+            yield from _walk(node, directory)
+        else:
+            yield directory, node
+
+# Structure overview printed after generation
+_BEE_KMP_STRUCTURE = """\
+📂 Structure:
+  ├── shared/           # KMP+CMP core
+  │   ├── features/     # Feed, Compose, Thread, etc.
+  │   ├── domain/       # Models, repos, use cases
+  │   ├── data/         # Network, local storage
+  │   ├── ui/           # Components, theme, animations
+  │   ├── gamification/ # XP, badges, streaks
+  │   └── safety/       # Content filter, vibe check
+  ├── androidApp/       # Android target
+  ├── iosApp/           # iOS target
+"""
+
+# ASCII stand-ins for the generator's emoji and box-drawing characters
+_ASCII_FALLBACK = str.maketrans({
+    "🐝": "*", "🍯": "*", "✅": "[OK]", "❌": "[ERROR]", "📁": ">", "📂": ">",
+    "├": "+", "└": "`", "│": "|", "─": "-",
+})
+
+def _console(text: str) -> str:
+    """Return text as-is if stdout can encode it, otherwise downgraded to ASCII"""
+    encoding = getattr(sys.stdout, "encoding", None)
+    # No encoding means an in-memory text stream, which holds anything
+    if encoding is None or codecs.lookup(encoding).name == "utf-8":
+        return text
+    try:
+        text.encode(encoding)
+        return text
+    except UnicodeEncodeError:
+        return text.translate(_ASCII_FALLBACK).encode(encoding, "replace").decode(encoding)
+
+class _ScaffoldSpec(NamedTuple):
+    """A manifest tree resolved into the exact work generate() performs"""
+    dirs: Tuple[str, ...]        # every directory, parents before children
+    batches: Tuple[_Batch, ...]  # (directory, file names) per leaf
+    
+    @classmethod
+    def compile(cls, tree: _Tree) -> "_ScaffoldSpec":
+        """Flatten a manifest tree and derive its directory closure"""
+        batches = tuple(_walk(tree))
+        # A path listed twice would be created twice and counted twice in
+        # the summary; reject it here rather than with an assert, which -O
+        # would strip. This only catches duplicates reached through
+        # differently spelled keys (e.g. "a": {"b": ...} and "a/b"); a key
+        # repeated in one dict literal is already collapsed by Python
+        paths = [os.path.join(d, name) for d, names in batches for name in names]
+        if len(paths) != len(set(paths)):
+            raise ValueError("duplicate paths in scaffold manifest")
+        dirs = set()
+        for directory, _ in batches:
+            # Stop climbing at the first ancestor already recorded
+            while directory and directory not in dirs:
+                dirs.add(directory)
+                directory = os.path.dirname(directory)
+        return cls(
+            dirs=tuple(sorted(dirs, key=lambda d: d.count("/"))),
+            batches=batches,
+        )
+
+@lru_cache(maxsize=None)
+def _bee_kmp_spec() -> _ScaffoldSpec:
+    """Compile the Bee KMP manifest once; it is static for the process"""
+    return _ScaffoldSpec.compile(_BEE_KMP_TREE)
+
+class BeeKMPGenerator:
+    """Generate fresh Bee KMP structure"""
+    __slots__ = ("base_path", "_base_abs")
+    
+    def __init__(self, base_path: str = "./bee-kmp"):
+        self.base_path = Path(base_path)
+        # Absolute and lexically normalised once, up front: used for every
+        # join and the summary, so a '..' in base_path is collapsed here
+        self._base_abs = os.path.abspath(self.base_path)
+    
+    def _create_dirs(self) -> None:
+        """Create the scaffold directory tree with one mkdir per directory"""
+        os.makedirs(self._base_abs, exist_ok=True)
+        # Parents always precede children, so a plain mkdir never has to
+        # walk (or stat) the ancestors the way makedirs does
+        for directory in _bee_kmp_spec().dirs:
+            try:
+                os.mkdir(os.path.join(self._base_abs, directory))
+            except FileExistsError:
+                pass
+    
+    def _create_batch(self, batch: _Batch) -> int:
+        """Create one manifest directory and any of its files that are missing"""
+        directory, names = batch
+        directory = os.path.join(self._base_abs, directory)
+        
+        # Resolve the directory once; each create is then a single-component
+        # lookup instead of a walk of the full path
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY) if _HAVE_DIR_FD else None
+        try:
+            # Scaffold files are empty, so an existing entry already matches
+            # what we would write; leave it (and its mtime) alone
+            existing = set(os.listdir(directory if dir_fd is None else dir_fd))
+            missing = [name for name in names if name not in existing]
+            for name in missing:
+                _touch(name if dir_fd is not None else os.path.join(directory, name), dir_fd)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+        return len(missing)
+    
+    def _is_complete(self) -> bool:
+        """Check whether every scaffold file is already present"""
+        # One listdir per manifest directory; no single file can stand in
+        # for the tree, since a rebranded or hand-made project may share it
+        for directory, names in _bee_kmp_spec().batches:
+            try:
+                existing = os.listdir(os.path.join(self._base_abs, directory))
+            except (FileNotFoundError, NotADirectoryError):
+                return False
+            if not set(names).issubset(existing):
+                return False
+        return True
+    
+    def generate_zip(self) -> bytes:
+        """Build the scaffold as an in-memory zip archive, without touching disk"""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+            for directory, names in _bee_kmp_spec().batches:
+                for name in names:
+                    # ZipInfo defaults to a fixed 1980 timestamp, so the
+                    # archive bytes are reproducible across runs
+                    info = zipfile.ZipInfo(f"{directory}/{name}" if directory else name)
+                    info.external_attr = 0o644 << 16
+                    archive.writestr(info, b"")
+        return buffer.getvalue()
+    
+    def generate(self, force: bool = False):
+        """Generate complete Bee KMP+CMP structure"""
+        # Only the generator needs a thread pool; keep it off the import path
+        from concurrent.futures import ThreadPoolExecutor
+        
+        print(_console("🐝 Generating Bee KMP+CMP Structure...\n🍯 Where conversations buzz\n"))
+        
+        # Everything below writes through base_path, so refuse to follow a
+        # symlink planted in its place; checked once, not per file. Links in
+        # its ancestors (e.g. /tmp on macOS) are the caller's own choice
+        if os.path.islink(self._base_abs):
+            print(_console(f"❌ Error: Base path '{self.base_path}' is a symlink!"))
+            return
+        
+        if not force and self._is_complete():
+            print(_console(f"✅ Scaffold already present at {self._base_abs} (use force=True to refill)"))
+            return
+        
+        self._create_dirs()
+        
+        # File creation is pure blocking I/O, so overlap it on a thread pool.
+        # Each task owns one directory and writes all of its siblings, so
+        # the pool sees one hand-off per directory rather than per file.
+        with ThreadPoolExecutor() as executor:
+            created = sum(executor.map(self._create_batch, _bee_kmp_spec().batches))
+        
+        # Emit the whole summary with one write rather than a print per line;
+        # the structure diagram is only for humans, so skip it when piped
+        isatty = getattr(sys.stdout, "isatty", None)
+        sys.stdout.write(_console(
+            f"✅ Created {created} empty files\n"
+            f"📁 Location: {self._base_abs}\n"
+            + ("\n" + _BEE_KMP_STRUCTURE if isatty and isatty() else "")
+        ))